@@ -1,10 +1,19 @@
 # Global imports
+import json
 import logging
 
 import requests
 
 from easyeda2kicad import __version__
 
+# orjson is an optional faster drop-in for the EasyEDA JSON payloads
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 API_ENDPOINT = "https://easyeda.com/api/products/{lcsc_id}/components?version=6.4.19.5"
 ENDPOINT_3D_MODEL = "https://modules.easyeda.com/3dmodel/{uuid}"
 ENDPOINT_3D_MODEL_STEP = "https://modules.easyeda.com/qAxj6KHrDKw4blvCG8QJPs7Y/{uuid}"
@@ -24,7 +33,7 @@ class EasyedaApi:
 
     def get_info_from_easyeda_api(self, lcsc_id: str) -> dict:
         r = requests.get(url=API_ENDPOINT.format(lcsc_id=lcsc_id), headers=self.headers)
-        api_response = r.json()
+        api_response = json_loads(r.content)
 
         if not api_response or (
             "code" in api_response and api_response["success"] is False
@@ -32,7 +41,7 @@ class EasyedaApi:
             logging.debug(f"{api_response}")
             return {}
 
-        return r.json()
+        return api_response
 
     def get_cad_data_of_component(self, lcsc_id: str) -> dict:
         cp_cad_info = self.get_info_from_easyeda_api(lcsc_id=lcsc_id)
@@ -1,95 +1,70 @@
 # Global imports
-import json
 import logging
+from typing import List
 
-from easyeda2kicad.easyeda.easyeda_api import EasyedaApi
+from easyeda2kicad.easyeda.easyeda_api import EasyedaApi, json_loads
 from easyeda2kicad.easyeda.parameters_easyeda import *
 
 
+def create_ee_object(ee_class: type, ee_fields: List[str]):
+    # EasyEDA fields are positional, in the same order as the dataclass fields
+    return ee_class(*ee_fields[: len(ee_class.__dataclass_fields__)])
+
+
 def add_easyeda_pin(pin_data: str, ee_symbol: EeSymbol):
     segments = pin_data.split("^^")
     ee_segments = [seg.split("~") for seg in segments]
 
-    pin_settings = EeSymbolPinSettings(
-        **dict(zip(EeSymbolPinSettings.__fields__, ee_segments[0][1:]))
-    )
-    pin_dot = EeSymbolPinDot(
-        dot_x=float(ee_segments[1][0]), dot_y=float(ee_segments[1][1])
-    )
+    pin_settings = create_ee_object(EeSymbolPinSettings, ee_segments[0][1:])
     pin_path = EeSymbolPinPath(path=ee_segments[2][0], color=ee_segments[2][1])
-    pin_name = EeSymbolPinName(
-        **dict(zip(EeSymbolPinName.__fields__, ee_segments[3][:]))
-    )
-
-    pin_dot_bis = EeSymbolPinDotBis(
-        is_displayed=ee_segments[5][0],
-        circle_x=float(ee_segments[5][1]),
-        circle_y=float(ee_segments[5][2]),
-    )
-    pin_clock = EeSymbolPinClock(is_displayed=ee_segments[6][0], path=ee_segments[6][1])
+    pin_name = create_ee_object(EeSymbolPinName, ee_segments[3])
 
     ee_symbol.pins.append(
         EeSymbolPin(
             settings=pin_settings,
-            pin_dot=pin_dot,
             pin_path=pin_path,
             name=pin_name,
-            dot=pin_dot_bis,
-            clock=pin_clock,
+            segments=ee_segments,
         )
     )
 
 
 def add_easyeda_rectangle(rectangle_data: str, ee_symbol: EeSymbol):
     ee_symbol.rectangles.append(
-        EeSymbolRectangle(
-            **dict(zip(EeSymbolRectangle.__fields__, rectangle_data.split("~")[1:]))
-        )
+        create_ee_object(EeSymbolRectangle, rectangle_data.split("~")[1:])
     )
 
 
 def add_easyeda_polyline(polyline_data: str, ee_symbol: EeSymbol):
     ee_symbol.polylines.append(
-        EeSymbolPolyline(
-            **dict(zip(EeSymbolPolyline.__fields__, polyline_data.split("~")[1:]))
-        )
+        create_ee_object(EeSymbolPolyline, polyline_data.split("~")[1:])
     )
 
 
 def add_easyeda_polygon(polygon_data: str, ee_symbol: EeSymbol):
     ee_symbol.polygons.append(
-        EeSymbolPolygon(
-            **dict(zip(EeSymbolPolygon.__fields__, polygon_data.split("~")[1:]))
-        )
+        create_ee_object(EeSymbolPolygon, polygon_data.split("~")[1:])
     )
 
 
 def add_easyeda_path(path_data: str, ee_symbol: EeSymbol):
-    ee_symbol.paths.append(
-        EeSymbolPath(**dict(zip(EeSymbolPath.__fields__, path_data.split("~")[1:])))
-    )
+    ee_symbol.paths.append(create_ee_object(EeSymbolPath, path_data.split("~")[1:]))
 
 
 def add_easyeda_circle(circle_data: str, ee_symbol: EeSymbol):
     ee_symbol.circles.append(
-        EeSymbolCircle(
-            **dict(zip(EeSymbolCircle.__fields__, circle_data.split("~")[1:]))
-        )
+        create_ee_object(EeSymbolCircle, circle_data.split("~")[1:])
     )
 
 
 def add_easyeda_ellipse(ellipse_data: str, ee_symbol: EeSymbol):
     ee_symbol.ellipses.append(
-        EeSymbolEllipse(
-            **dict(zip(EeSymbolEllipse.__fields__, ellipse_data.split("~")[1:]))
-        )
+        create_ee_object(EeSymbolEllipse, ellipse_data.split("~")[1:])
     )
 
 
 def add_easyeda_arc(arc_data: str, ee_symbol: EeSymbol):
-    ee_symbol.arcs.append(
-        EeSymbolArc(**dict(zip(EeSymbolArc.__fields__, arc_data.split("~")[1:])))
-    )
+    ee_symbol.arcs.append(create_ee_object(EeSymbolArc, arc_data.split("~")[1:]))
 
 
 easyeda_handlers = {
@@ -143,6 +118,18 @@ class EasyedaSymbolImporter:
         return new_ee_symbol
 
 
+easyeda_footprint_handlers = {
+    "PAD": (EeFootprintPad, "pads"),
+    "TRACK": (EeFootprintTrack, "tracks"),
+    "HOLE": (EeFootprintHole, "holes"),
+    "VIA": (EeFootprintVia, "vias"),
+    "CIRCLE": (EeFootprintCircle, "circles"),
+    "ARC": (EeFootprintArc, "arcs"),
+    "RECT": (EeFootprintRectangle, "rectangles"),
+    "TEXT": (EeFootprintText, "texts"),
+}
+
+
 class EasyedaFootprintImporter:
     def __init__(self, easyeda_cp_cad_data: dict):
         self.input = easyeda_cp_cad_data
@@ -173,49 +160,13 @@ class EasyedaFootprintImporter:
         )
 
         for line in ee_data_str["shape"]:
-            ee_designator = line.split("~")[0]
-            ee_fields = line.split("~")[1:]
+            ee_designator, *ee_fields = line.split("~")
 
-            if ee_designator == "PAD":
-                ee_pad = EeFootprintPad(
-                    **dict(zip(EeFootprintPad.__fields__, ee_fields[:18]))
-                )
-                new_ee_footprint.pads.append(ee_pad)
-            elif ee_designator == "TRACK":
-                ee_track = EeFootprintTrack(
-                    **dict(zip(EeFootprintTrack.__fields__, ee_fields))
-                )
-                new_ee_footprint.tracks.append(ee_track)
-            elif ee_designator == "HOLE":
-                ee_hole = EeFootprintHole(
-                    **dict(zip(EeFootprintHole.__fields__, ee_fields))
-                )
-                new_ee_footprint.holes.append(ee_hole)
-            elif ee_designator == "VIA":
-                ee_via = EeFootprintVia(
-                    **dict(zip(EeFootprintVia.__fields__, ee_fields))
+            if ee_designator in easyeda_footprint_handlers:
+                ee_class, primitives_name = easyeda_footprint_handlers[ee_designator]
+                getattr(new_ee_footprint, primitives_name).append(
+                    create_ee_object(ee_class, ee_fields)
                 )
-                new_ee_footprint.vias.append(ee_via)
-            elif ee_designator == "CIRCLE":
-                ee_circle = EeFootprintCircle(
-                    **dict(zip(EeFootprintCircle.__fields__, ee_fields))
-                )
-                new_ee_footprint.circles.append(ee_circle)
-            elif ee_designator == "ARC":
-                ee_arc = EeFootprintArc(
-                    **dict(zip(EeFootprintArc.__fields__, ee_fields))
-                )
-                new_ee_footprint.arcs.append(ee_arc)
-            elif ee_designator == "RECT":
-                ee_rectangle = EeFootprintRectangle(
-                    **dict(zip(EeFootprintRectangle.__fields__, ee_fields))
-                )
-                new_ee_footprint.rectangles.append(ee_rectangle)
-            elif ee_designator == "TEXT":
-                ee_text = EeFootprintText(
-                    **dict(zip(EeFootprintText.__fields__, ee_fields))
-                )
-                new_ee_footprint.texts.append(ee_text)
             elif ee_designator == "SVGNODE":
                 new_ee_footprint.model_3d = Easyeda3dModelImporter(
                     easyeda_cp_cad_data=[line], download_raw_3d_model=False
@@ -260,19 +211,15 @@ class Easyeda3dModelImporter:
             ee_designator = line.split("~")[0]
             if ee_designator == "SVGNODE":
                 raw_json = line.split("~")[1:][0]
-                return json.loads(raw_json)["attrs"]
+                return json_loads(raw_json)["attrs"]
         return {}
 
     def parse_3d_model_info(self, info: dict) -> Ee3dModel:
         return Ee3dModel(
             name=info["title"],
             uuid=info["uuid"],
-            translation=Ee3dModelBase(
-                x=info["c_origin"].split(",")[0],
-                y=info["c_origin"].split(",")[1],
-                z=info["z"],
-            ),
-            rotation=Ee3dModelBase(
-                **dict(zip(Ee3dModelBase.__fields__, info["c_rotation"].split(",")))
-            ),
+            tx=info["c_origin"].split(",")[0],
+            ty=info["c_origin"].split(",")[1],
+            tz=info["z"],
+            **dict(zip(("rx", "ry", "rz"), info["c_rotation"].split(","))),
         )
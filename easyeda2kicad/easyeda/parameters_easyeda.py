@@ -1,11 +1,15 @@
 # Global imports
+import math
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Union
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple, Optional, Tuple, Union
 
-from pydantic import BaseModel, field_validator
+from easyeda2kicad.easyeda.svg_path_parser import parse_svg_path, tokenize_svg_path
 
-from easyeda2kicad.easyeda.svg_path_parser import parse_svg_path
+# slots=True is only understood by dataclass() from Python 3.10 onwards
+SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class EasyedaPinType(Enum):
@@ -16,14 +20,75 @@ class EasyedaPinType(Enum):
     power = 4
 
 
+_PIN_TYPE_BY_ID = {pin_type.value: pin_type for pin_type in EasyedaPinType}
+
+
+# ------------------------- Coercion helpers -------------------------
+
+_TRUE_STRINGS = frozenset(("1", "on", "t", "true", "y", "yes"))
+
+
+def _to_bool(field: Union[str, bool, int, float]) -> bool:
+    if isinstance(field, str):
+        return field.lower() in _TRUE_STRINGS
+    return bool(field)
+
+
+def _to_int(field: Union[str, int, float]) -> int:
+    return int(float(field))
+
+
+def _show_to_bool(field: Union[str, bool]) -> bool:
+    return True if field == "show" else _to_bool(field)
+
+
+def _empty_to_false(field: Union[str, bool]) -> bool:
+    return _to_bool(field or False)
+
+
+def _empty_to_zero(field: Union[str, float]) -> float:
+    return float(field or 0.0)
+
+
+def _empty_or_none_to_nan(field: Union[str, float, None]) -> float:
+    return float(field) if field not in ("", None) else math.nan
+
+
+def _parse_font_size(font_size: Union[str, float]) -> float:
+    if type(font_size) is not str:
+        return float(font_size or 7.0)
+    if font_size.endswith("pt"):
+        return float(font_size[:-2])
+    return float(font_size or 7.0)
+
+
+def _parse_background_filling(fill_color: Union[str, bool]) -> bool:
+    if isinstance(fill_color, bool):
+        return fill_color
+    return bool(fill_color and fill_color.lower() != "none")
+
+
+@lru_cache(maxsize=1024)
+def parse_points(points: str) -> Tuple[Tuple[float, float], ...]:
+    values = [float(value) for value in points.replace(",", " ").split()]
+    return tuple(zip(values[::2], values[1::2]))
+
+
+def _parse_pin_type(field: Union[str, int, EasyedaPinType]) -> EasyedaPinType:
+    if isinstance(field, EasyedaPinType):
+        return field
+    return _PIN_TYPE_BY_ID.get(int(field or 0), EasyedaPinType.unspecified)
+
+
 # ------------------------- Symbol -------------------------
-class EeSymbolBbox(BaseModel):
+class EeSymbolBbox(NamedTuple):
     x: float
     y: float
 
 
 # ---------------- PIN ----------------
-class EeSymbolPinSettings(BaseModel):
+@dataclass(**SLOTS)
+class EeSymbolPinSettings:
     is_displayed: bool
     type: EasyedaPinType
     spice_pin_number: str
@@ -33,47 +98,36 @@ class EeSymbolPinSettings(BaseModel):
     id: str
     is_locked: bool
 
-    @field_validator("is_displayed", mode="before")
-    @classmethod
-    def parse_display_field(cls, field: str) -> bool:
-        return True if field == "show" else field
-
-    @field_validator("is_locked", mode="before")
-    @classmethod
-    def empty_str_lock(cls, is_locked: str) -> str:
-        return is_locked or False
-
-    @field_validator("rotation", mode="before")
-    @classmethod
-    def empty_str_rotation(cls, rotation: str) -> str:
-        return rotation or 0.0
+    def __post_init__(self) -> None:
+        self.is_displayed = _show_to_bool(self.is_displayed)
+        self.type = _parse_pin_type(self.type)
+        self.pos_x = float(self.pos_x)
+        self.pos_y = float(self.pos_y)
+        self.rotation = _to_int(self.rotation or 0)
+        self.is_locked = _empty_to_false(self.is_locked)
 
-    @field_validator("type", mode="before")
-    @classmethod
-    def convert_pin_type(cls, field: str) -> str:
-        return (
-            EasyedaPinType(int(field or 0))
-            if int(field or 0) in EasyedaPinType._value2member_map_
-            else EasyedaPinType._unspecified
-        )
 
-
-class EeSymbolPinDot(BaseModel):
+@dataclass(**SLOTS)
+class EeSymbolPinDot:
     dot_x: float
     dot_y: float
 
+    def __post_init__(self) -> None:
+        self.dot_x = float(self.dot_x)
+        self.dot_y = float(self.dot_y)
+
 
-class EeSymbolPinPath(BaseModel):
+@dataclass(**SLOTS)
+class EeSymbolPinPath:
     path: str
     color: str
 
-    @field_validator("path", mode="before")
-    @classmethod
-    def tune_path(cls, field: str) -> str:
-        return field.replace("v", "h")
+    def __post_init__(self) -> None:
+        self.path = self.path.replace("v", "h")
 
 
-class EeSymbolPinName(BaseModel):
+@dataclass(**SLOTS)
+class EeSymbolPinName:
     is_displayed: bool
     pos_x: float
     pos_y: float
@@ -83,61 +137,109 @@ class EeSymbolPinName(BaseModel):
     font: str
     font_size: float
 
-    @field_validator("font_size", mode="before")
-    @classmethod
-    def empty_str_font(cls, font_size: str) -> float:
-        if isinstance(font_size, str) and "pt" in font_size:
-            return float(font_size.replace("pt", ""))
-        return font_size or 7.0
-
-    @field_validator("is_displayed", mode="before")
-    @classmethod
-    def parse_display_field(cls, field: str) -> str:
-        return True if field == "show" else field
-
-    @field_validator("rotation", mode="before")
-    @classmethod
-    def empty_str_rotation(cls, rotation: str) -> str:
-        return rotation or 0.0
+    def __post_init__(self) -> None:
+        self.is_displayed = _show_to_bool(self.is_displayed)
+        self.pos_x = float(self.pos_x)
+        self.pos_y = float(self.pos_y)
+        self.rotation = _to_int(self.rotation or 0)
+        self.font_size = _parse_font_size(self.font_size)
 
 
-class EeSymbolPinDotBis(BaseModel):
+@dataclass(**SLOTS)
+class EeSymbolPinDotBis:
     is_displayed: bool
     circle_x: float
     circle_y: float
 
-    @field_validator("is_displayed", mode="before")
-    @classmethod
-    def parse_display_field(cls, field: str) -> str:
-        return True if field == "show" else field
+    def __post_init__(self) -> None:
+        self.is_displayed = _show_to_bool(self.is_displayed)
+        self.circle_x = float(self.circle_x)
+        self.circle_y = float(self.circle_y)
 
 
-class EeSymbolPinClock(BaseModel):
+@dataclass(**SLOTS)
+class EeSymbolPinClock:
     is_displayed: bool
     path: str
 
-    @field_validator("is_displayed", mode="before")
-    @classmethod
-    def parse_display_field(cls, field: str) -> str:
-        return True if field == "show" else field
+    def __post_init__(self) -> None:
+        self.is_displayed = _show_to_bool(self.is_displayed)
+
+
+_NOT_PARSED = object()
 
 
-@dataclass
 class EeSymbolPin:
-    settings: EeSymbolPinSettings
-    pin_dot: EeSymbolPinDot
-    pin_path: EeSymbolPinPath
-    name: EeSymbolPinName
-    dot: EeSymbolPinDotBis
-    clock: EeSymbolPinClock
+    # pin_dot, dot and clock are kept as raw segments and only parsed on first
+    # access, they are None when their segment is missing or empty
+    __slots__ = (
+        "settings",
+        "pin_path",
+        "name",
+        "_segments",
+        "_pin_dot",
+        "_dot",
+        "_clock",
+    )
+
+    def __init__(
+        self,
+        settings: EeSymbolPinSettings,
+        pin_path: EeSymbolPinPath,
+        name: EeSymbolPinName,
+        segments: List[List[str]],
+    ) -> None:
+        self.settings = settings
+        self.pin_path = pin_path
+        self.name = name
+        self._segments = segments
+        self._pin_dot = self._dot = self._clock = _NOT_PARSED
+
+    def _get_segment(self, index: int) -> List[str]:
+        segment = self._segments[index] if index < len(self._segments) else []
+        return segment if any(segment) else []
+
+    @property
+    def pin_dot(self) -> Optional[EeSymbolPinDot]:
+        if self._pin_dot is _NOT_PARSED:
+            segment = self._get_segment(1)
+            self._pin_dot = (
+                EeSymbolPinDot(dot_x=segment[0], dot_y=segment[1]) if segment else None
+            )
+        return self._pin_dot
+
+    @property
+    def dot(self) -> Optional[EeSymbolPinDotBis]:
+        if self._dot is _NOT_PARSED:
+            segment = self._get_segment(5)
+            self._dot = (
+                EeSymbolPinDotBis(
+                    is_displayed=segment[0], circle_x=segment[1], circle_y=segment[2]
+                )
+                if segment
+                else None
+            )
+        return self._dot
+
+    @property
+    def clock(self) -> Optional[EeSymbolPinClock]:
+        if self._clock is _NOT_PARSED:
+            segment = self._get_segment(6)
+            self._clock = (
+                EeSymbolPinClock(is_displayed=segment[0], path=segment[1])
+                if segment
+                else None
+            )
+        return self._clock
 
 
 # ---------------- RECTANGLE ----------------
-class EeSymbolRectangle(BaseModel):
+@dataclass(**SLOTS)
+class EeSymbolRectangle:
     pos_x: float
     pos_y: float
-    rx: Union[float, None] = None
-    ry: Union[float, None] = None
+    rx: float  # NaN when the corners are not rounded
+    ry: float
     width: float
     height: float
     stroke_color: str
@@ -147,14 +249,21 @@ class EeSymbolRectangle(BaseModel):
     id: str
     is_locked: bool
 
-    @field_validator("*", mode="before")
-    @classmethod
-    def empty_str_to_none(cls, field: str) -> str:
-        return field or None
+    def __post_init__(self) -> None:
+        self.pos_x = float(self.pos_x)
+        self.pos_y = float(self.pos_y)
+        self.rx = _empty_or_none_to_nan(self.rx)
+        self.ry = _empty_or_none_to_nan(self.ry)
+        self.width = float(self.width)
+        self.height = float(self.height)
+        self.stroke_color = sys.intern(self.stroke_color)
+        self.stroke_style = sys.intern(self.stroke_style)
+        self.is_locked = _empty_to_false(self.is_locked)
 
 
 # ---------------- CIRCLE ----------------
-class EeSymbolCircle(BaseModel):
+@dataclass(**SLOTS)
+class EeSymbolCircle:
     center_x: float
     center_y: float
     radius: float
@@ -165,19 +274,19 @@ class EeSymbolCircle(BaseModel):
     id: str
     is_locked: bool
 
-    @field_validator("is_locked", mode="before")
-    @classmethod
-    def empty_str_lock(cls, field: str) -> str:
-        return field or False
-
-    @field_validator("fill_color", mode="before")
-    @classmethod
-    def parse_background_filling(cls, fill_color: str) -> str:
-        return bool(fill_color and fill_color.lower() != "none")
+    def __post_init__(self) -> None:
+        self.center_x = float(self.center_x)
+        self.center_y = float(self.center_y)
+        self.radius = float(self.radius)
+        self.fill_color = _parse_background_filling(self.fill_color)
+        self.stroke_color = sys.intern(self.stroke_color)
+        self.stroke_style = sys.intern(self.stroke_style)
+        self.is_locked = _empty_to_false(self.is_locked)
 
 
 # ---------------- ARC ----------------
-class EeSymbolArc(BaseModel):
+@dataclass(**SLOTS)
+class EeSymbolArc:
     path: list
     helper_dots: str
     stroke_color: str
@@ -187,23 +296,17 @@ class EeSymbolArc(BaseModel):
     id: str
     is_locked: bool
 
-    @field_validator("is_locked", mode="before")
-    @classmethod
-    def empty_str_lock(cls, field: str) -> str:
-        return field or False
-
-    @field_validator("fill_color", mode="before")
-    @classmethod
-    def parse_background_filling(cls, fill_color: str) -> str:
-        return bool(fill_color and fill_color.lower() != "none")
+    def __post_init__(self) -> None:
+        if isinstance(self.path, str):
+            self.path = parse_svg_path(svg_path=self.path)
+        self.fill_color = _parse_background_filling(self.fill_color)
+        self.stroke_color = sys.intern(self.stroke_color)
+        self.stroke_style = sys.intern(self.stroke_style)
+        self.is_locked = _empty_to_false(self.is_locked)
 
-    @field_validator("path", mode="before")
-    @classmethod
-    def convert_svg_path(cls, path: str) -> list:
-        return parse_svg_path(svg_path=path)
 
-
-class EeSymbolEllipse(BaseModel):
+@dataclass(**SLOTS)
+class EeSymbolEllipse:
     center_x: float
     center_y: float
     radius_x: float
@@ -215,19 +318,20 @@ class EeSymbolEllipse(BaseModel):
     id: str
     is_locked: bool
 
-    @field_validator("is_locked", mode="before")
-    @classmethod
-    def empty_str_lock(cls, field: str) -> str:
-        return field or False
-
-    @field_validator("fill_color", mode="before")
-    @classmethod
-    def parse_background_filling(cls, fill_color: str) -> str:
-        return bool(fill_color and fill_color.lower() != "none")
+    def __post_init__(self) -> None:
+        self.center_x = float(self.center_x)
+        self.center_y = float(self.center_y)
+        self.radius_x = float(self.radius_x)
+        self.radius_y = float(self.radius_y)
+        self.fill_color = _parse_background_filling(self.fill_color)
+        self.stroke_color = sys.intern(self.stroke_color)
+        self.stroke_style = sys.intern(self.stroke_style)
+        self.is_locked = _empty_to_false(self.is_locked)
 
 
 # ---------------- POLYLINE ----------------
-class EeSymbolPolyline(BaseModel):
+@dataclass(**SLOTS)
+class EeSymbolPolyline:
     points: str
     stroke_color: str
     stroke_width: str
@@ -236,18 +340,19 @@ class EeSymbolPolyline(BaseModel):
     id: str
     is_locked: bool
 
-    @field_validator("is_locked", mode="before")
-    @classmethod
-    def empty_str_lock(cls, field: str) -> str:
-        return field or False
+    def __post_init__(self) -> None:
+        self.fill_color = _parse_background_filling(self.fill_color)
+        self.stroke_color = sys.intern(self.stroke_color)
+        self.stroke_style = sys.intern(self.stroke_style)
+        self.is_locked = _empty_to_false(self.is_locked)
 
-    @field_validator("fill_color", mode="before")
-    @classmethod
-    def parse_background_filling(cls, fill_color: str) -> str:
-        return bool(fill_color and fill_color.lower() != "none")
+    @property
+    def xy(self) -> Tuple[Tuple[float, float], ...]:
+        return parse_points(self.points)
 
 
 # ---------------- POLYGON ----------------
+@dataclass(**SLOTS)
 class EeSymbolPolygon(EeSymbolPolyline):
     ...
 
@@ -256,7 +361,8 @@ class EeSymbolPolygon(EeSymbolPolyline):
 # TODO : EeSymbolPath.paths should be a SVG PATH https://www.w3.org/TR/SVG11/paths.html#PathElement
 # TODO : small svg parser and then convert to kicad
 # TODO: support bezier curve, currently paths are seen as polygone
-class EeSymbolPath(BaseModel):
+@dataclass(**SLOTS)
+class EeSymbolPath:
     paths: str
     stroke_color: str
     stroke_width: str
@@ -265,23 +371,19 @@ class EeSymbolPath(BaseModel):
     id: str
     is_locked: bool
 
-    @field_validator("is_locked", mode="before")
-    @classmethod
-    def empty_str_lock(cls, field: str) -> str:
-        return field or False
-
-    @field_validator("fill_color", mode="before")
-    @classmethod
-    def parse_background_filling(cls, fill_color: str) -> str:
-        return bool(fill_color and fill_color.lower() != "none")
+    def __post_init__(self) -> None:
+        self.fill_color = _parse_background_filling(self.fill_color)
+        self.stroke_color = sys.intern(self.stroke_color)
+        self.stroke_style = sys.intern(self.stroke_style)
+        self.is_locked = _empty_to_false(self.is_locked)
 
-    # @validator("paths", pre=True)
-    # def clean_svg_path(cls, paths:str):
-    #     return paths.replace("M", "").replace("C","")
+    @property
+    def tokens(self) -> Tuple[Tuple[str, Tuple[float, ...]], ...]:
+        return tokenize_svg_path(self.paths)
 
 
 # ---------------- SYMBOL ----------------
-@dataclass
+@dataclass(frozen=True, **SLOTS)
 class EeSymbolInfo:
     name: str = ""
     prefix: str = ""
@@ -292,7 +394,7 @@ class EeSymbolInfo:
     jlc_id: str = ""
 
 
-@dataclass
+@dataclass(**SLOTS)
 class EeSymbol:
     info: EeSymbolInfo
     bbox: EeSymbolBbox
@@ -310,22 +412,44 @@ class EeSymbol:
 
 
 def convert_to_mm(dim: float) -> float:
+    # EasyEDA unit is 10 mil. Keep this exact operation order: folding it into
+    # a single 0.254 factor rounds differently for some values.
     return float(dim) * 10 * 0.0254
 
 
-@dataclass
-class EeFootprintBbox:
+def convert_many_to_mm(objs: Iterable, attrs: Tuple[str, ...]) -> None:
+    # One pass over a whole list of primitives sharing the same layout
+    for obj in objs:
+        for attr in attrs:
+            setattr(obj, attr, convert_to_mm(getattr(obj, attr)))
 
+
+class EeFootprintBbox(NamedTuple):
     x: float
     y: float
 
-    def convert_to_mm(self) -> None:
-        self.x = convert_to_mm(self.x)
-        self.y = convert_to_mm(self.y)
 
+def bbox_to_mm(bbox: EeFootprintBbox) -> EeFootprintBbox:
+    return EeFootprintBbox(x=convert_to_mm(bbox.x), y=convert_to_mm(bbox.y))
+
+
+class PadShape(str, Enum):
+    ELLIPSE = "ELLIPSE"
+    RECT = "RECT"
+    OVAL = "OVAL"
+    POLYGON = "POLYGON"
+
+
+_PAD_SHAPE_BY_NAME = {pad_shape.value: pad_shape for pad_shape in PadShape}
 
-class EeFootprintPad(BaseModel):
-    shape: str
+
+def _parse_pad_shape(shape: str) -> Union[PadShape, str]:
+    return _PAD_SHAPE_BY_NAME.get(shape) or sys.intern(shape)
+
+
+@dataclass(**SLOTS)
+class EeFootprintPad:
+    shape: Union[PadShape, str]
     center_x: float
     center_y: float
     width: float
@@ -342,26 +466,36 @@ class EeFootprintPad(BaseModel):
     is_plated: bool
     is_locked: bool
 
-    def convert_to_mm(self) -> None:
-        self.center_x = convert_to_mm(self.center_x)
-        self.center_y = convert_to_mm(self.center_y)
-        self.width = convert_to_mm(self.width)
-        self.height = convert_to_mm(self.height)
-        self.hole_radius = convert_to_mm(self.hole_radius)
-        self.hole_length = convert_to_mm(self.hole_length)
-
-    @field_validator("is_locked", mode="before")
-    @classmethod
-    def empty_str_lock(cls, field: str) -> str:
-        return field or False
-
-    @field_validator("rotation", mode="before")
-    @classmethod
-    def empty_str_rotation(cls, field: str) -> str:
-        return field or 0.0
-
-
-class EeFootprintTrack(BaseModel):
+    MM_FIELDS = (
+        "center_x",
+        "center_y",
+        "width",
+        "height",
+        "hole_radius",
+        "hole_length",
+    )
+
+    def __post_init__(self) -> None:
+        self.shape = _parse_pad_shape(self.shape)
+        self.center_x = float(self.center_x)
+        self.center_y = float(self.center_y)
+        self.width = float(self.width)
+        self.height = float(self.height)
+        self.layer_id = _to_int(self.layer_id)
+        self.hole_radius = float(self.hole_radius)
+        self.rotation = _empty_to_zero(self.rotation)
+        self.hole_length = float(self.hole_length)
+        self.is_plated = _to_bool(self.is_plated)
+        self.net = sys.intern(self.net)
+        self.is_locked = _empty_to_false(self.is_locked)
+
+    @property
+    def xy(self) -> Tuple[Tuple[float, float], ...]:
+        return parse_points(self.points)
+
+
+@dataclass(**SLOTS)
+class EeFootprintTrack:
     stroke_width: float
     layer_id: int
     net: str
@@ -369,34 +503,38 @@ class EeFootprintTrack(BaseModel):
     id: str
     is_locked: bool
 
-    @field_validator("is_locked", mode="before")
-    @classmethod
-    def empty_str_lock(cls, field: str) -> str:
-        return field or False
+    MM_FIELDS = ("stroke_width",)
 
-    def convert_to_mm(self) -> None:
-        self.stroke_width = convert_to_mm(self.stroke_width)
+    def __post_init__(self) -> None:
+        self.stroke_width = float(self.stroke_width)
+        self.layer_id = _to_int(self.layer_id)
+        self.net = sys.intern(self.net)
+        self.is_locked = _empty_to_false(self.is_locked)
+
+    @property
+    def xy(self) -> Tuple[Tuple[float, float], ...]:
+        return parse_points(self.points)
 
 
-class EeFootprintHole(BaseModel):
+@dataclass(**SLOTS)
+class EeFootprintHole:
     center_x: float
     center_y: float
     radius: float
     id: str
     is_locked: bool
 
-    @field_validator("is_locked", mode="before")
-    @classmethod
-    def empty_str_lock(cls, field: str) -> str:
-        return field or False
+    MM_FIELDS = ("center_x", "center_y", "radius")
 
-    def convert_to_mm(self) -> None:
-        self.center_x = convert_to_mm(self.center_x)
-        self.center_y = convert_to_mm(self.center_y)
-        self.radius = convert_to_mm(self.radius)
+    def __post_init__(self) -> None:
+        self.center_x = float(self.center_x)
+        self.center_y = float(self.center_y)
+        self.radius = float(self.radius)
+        self.is_locked = _empty_to_false(self.is_locked)
 
 
-class EeFootprintVia(BaseModel):
+@dataclass(**SLOTS)
+class EeFootprintVia:
     center_x: float
     center_y: float
     diameter: float
@@ -405,19 +543,19 @@ class EeFootprintVia(BaseModel):
     id: str
     is_locked: bool
 
-    @field_validator("is_locked", mode="before")
-    @classmethod
-    def empty_str_lock(cls, field: str) -> str:
-        return field or False
+    MM_FIELDS = ("center_x", "center_y", "radius", "diameter")
 
-    def convert_to_mm(self) -> None:
-        self.center_x = convert_to_mm(self.center_x)
-        self.center_y = convert_to_mm(self.center_y)
-        self.radius = convert_to_mm(self.radius)
-        self.diameter = convert_to_mm(self.diameter)
+    def __post_init__(self) -> None:
+        self.center_x = float(self.center_x)
+        self.center_y = float(self.center_y)
+        self.diameter = float(self.diameter)
+        self.radius = float(self.radius)
+        self.net = sys.intern(self.net)
+        self.is_locked = _empty_to_false(self.is_locked)
 
 
-class EeFootprintCircle(BaseModel):
+@dataclass(**SLOTS)
+class EeFootprintCircle:
     cx: float
     cy: float
     radius: float
@@ -426,19 +564,19 @@ class EeFootprintCircle(BaseModel):
     id: str
     is_locked: bool
 
-    @field_validator("is_locked", mode="before")
-    @classmethod
-    def empty_str_lock(cls, field: str) -> str:
-        return field or False
+    MM_FIELDS = ("cx", "cy", "radius", "stroke_width")
 
-    def convert_to_mm(self) -> None:
-        self.cx = convert_to_mm(self.cx)
-        self.cy = convert_to_mm(self.cy)
-        self.radius = convert_to_mm(self.radius)
-        self.stroke_width = convert_to_mm(self.stroke_width)
+    def __post_init__(self) -> None:
+        self.cx = float(self.cx)
+        self.cy = float(self.cy)
+        self.radius = float(self.radius)
+        self.stroke_width = float(self.stroke_width)
+        self.layer_id = _to_int(self.layer_id)
+        self.is_locked = _empty_to_false(self.is_locked)
 
 
-class EeFootprintRectangle(BaseModel):
+@dataclass(**SLOTS)
+class EeFootprintRectangle:
     x: float
     y: float
     width: float
@@ -448,19 +586,20 @@ class EeFootprintRectangle(BaseModel):
     layer_id: int
     is_locked: bool
 
-    @field_validator("is_locked", mode="before")
-    @classmethod
-    def empty_str_lock(cls, field):
-        return False if field == "" else bool(float(field))
+    MM_FIELDS = ("x", "y", "width", "height")
 
-    def convert_to_mm(self):
-        self.x = convert_to_mm(self.x)
-        self.y = convert_to_mm(self.y)
-        self.width = convert_to_mm(self.width)
-        self.height = convert_to_mm(self.height)
+    def __post_init__(self) -> None:
+        self.x = float(self.x)
+        self.y = float(self.y)
+        self.width = float(self.width)
+        self.height = float(self.height)
+        self.stroke_width = float(self.stroke_width)
+        self.layer_id = _to_int(self.layer_id)
+        self.is_locked = False if self.is_locked == "" else bool(float(self.is_locked))
 
 
-class EeFootprintArc(BaseModel):
+@dataclass(**SLOTS)
+class EeFootprintArc:
     stroke_width: float
     layer_id: int
     net: str
@@ -469,13 +608,19 @@ class EeFootprintArc(BaseModel):
     id: str
     is_locked: bool
 
-    @field_validator("is_locked", mode="before")
-    @classmethod
-    def empty_str_lock(cls, field):
-        return False if field == "" else field
+    def __post_init__(self) -> None:
+        self.stroke_width = float(self.stroke_width)
+        self.layer_id = _to_int(self.layer_id)
+        self.net = sys.intern(self.net)
+        self.is_locked = _empty_to_false(self.is_locked)
 
+    @property
+    def tokens(self) -> Tuple[Tuple[str, Tuple[float, ...]], ...]:
+        return tokenize_svg_path(self.path)
 
-class EeFootprintText(BaseModel):
+
+@dataclass(**SLOTS)
+class EeFootprintText:
     type: str
     center_x: float
     center_y: float
@@ -491,33 +636,24 @@ class EeFootprintText(BaseModel):
     id: str
     is_locked: bool
 
-    @field_validator("is_displayed", mode="before")
-    @classmethod
-    def empty_str_display(cls, field):
-        return True if field == "" else field
-
-    @field_validator("is_locked", mode="before")
-    @classmethod
-    def empty_str_lock(cls, field):
-        return False if field == "" else field
-
-    @field_validator("rotation", mode="before")
-    @classmethod
-    def empty_str_rotation(cls, field):
-        return 0.0 if field == "" else field
-
-    def convert_to_mm(self):
+    MM_FIELDS = ("center_x", "center_y", "stroke_width", "font_size")
 
-        self.center_x = convert_to_mm(self.center_x)
-        self.center_y = convert_to_mm(self.center_y)
-        self.stroke_width = convert_to_mm(self.stroke_width)
-        self.font_size = convert_to_mm(self.font_size)
+    def __post_init__(self) -> None:
+        self.center_x = float(self.center_x)
+        self.center_y = float(self.center_y)
+        self.stroke_width = float(self.stroke_width)
+        self.rotation = _to_int(self.rotation or 0)
+        self.layer_id = _to_int(self.layer_id)
+        self.font_size = float(self.font_size)
+        self.is_displayed = self.is_displayed == "" or _to_bool(self.is_displayed)
+        self.net = sys.intern(self.net)
+        self.is_locked = _empty_to_false(self.is_locked)
 
 
 # ---------------- FOOTPRINT ----------------
 
 
-@dataclass
+@dataclass(frozen=True, **SLOTS)
 class EeFootprintInfo:
     name: str
     fp_type: str
@@ -525,32 +661,34 @@ class EeFootprintInfo:
 
 
 # ------------------------- 3D MODEL -------------------------
-class Ee3dModelBase(BaseModel):
-    x: float = 0.0
-    y: float = 0.0
-    z: float = 0.0
-
-    def convert_to_mm(self) -> None:
-        self.x = convert_to_mm(self.x)
-        self.y = convert_to_mm(self.y)
-        self.z = convert_to_mm(self.z)
-
-
-@dataclass
+@dataclass(**SLOTS)
 class Ee3dModel:
     name: str
     uuid: str
-    translation: Ee3dModelBase
-    rotation: Ee3dModelBase
+    tx: float = 0.0
+    ty: float = 0.0
+    tz: float = 0.0
+    rx: float = 0.0
+    ry: float = 0.0
+    rz: float = 0.0
     raw_obj: str = None
     step: bytes = None
 
+    MM_FIELDS = ("tx", "ty", "tz")
+
+    def __post_init__(self) -> None:
+        self.tx = float(self.tx)
+        self.ty = float(self.ty)
+        self.tz = float(self.tz)
+        self.rx = float(self.rx)
+        self.ry = float(self.ry)
+        self.rz = float(self.rz)
+
     def convert_to_mm(self) -> None:
-        self.translation.convert_to_mm()
-        # self.translation.z = self.translation.z
+        convert_many_to_mm(objs=(self,), attrs=self.MM_FIELDS)
 
 
-@dataclass
+@dataclass(**SLOTS)
 class ee_footprint:
     info: EeFootprintInfo
     bbox: EeFootprintBbox
@@ -563,3 +701,19 @@ class ee_footprint:
     arcs: List[EeFootprintArc] = field(default_factory=list)
     rectangles: List[EeFootprintRectangle] = field(default_factory=list)
     texts: List[EeFootprintText] = field(default_factory=list)
+
+    def convert_to_mm(self) -> None:
+        self.bbox = bbox_to_mm(self.bbox)
+        for primitives in (
+            self.pads,
+            self.tracks,
+            self.holes,
+            self.vias,
+            self.circles,
+            self.rectangles,
+            self.texts,
+        ):
+            if primitives:
+                convert_many_to_mm(objs=primitives, attrs=primitives[0].MM_FIELDS)
+        if self.model_3d is not None:
+            self.model_3d.convert_to_mm()
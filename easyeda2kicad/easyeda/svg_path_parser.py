@@ -3,7 +3,8 @@ import logging
 import re
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Union
+from functools import lru_cache
+from typing import List, Tuple, Union
 
 from pydantic import BaseModel, validator
 
@@ -40,26 +41,67 @@ svg_path_handlers = {
 }
 
 
-def parse_svg_path(svg_path: str) -> list:
-    if not svg_path.endswith(" "):
-        svg_path += " "
-    svg_path = svg_path.replace(",", " ")
+# Single pass tokenizer : commands are kept as str, coordinates become float
+_PATH_SCANNER = re.Scanner(
+    [
+        (r"[MLCQASTZHVmlcqastzhv]", lambda scanner, token: token),
+        (
+            r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?",
+            lambda scanner, token: float(token),
+        ),
+        (r"[\s,]+", None),
+    ]
+)
+
+
+@lru_cache(maxsize=1024)
+def tokenize_svg_path(svg_path: str) -> Tuple[Tuple[str, Tuple[float, ...]], ...]:
+    tokens, remainder = _PATH_SCANNER.scan(svg_path)
+    if remainder:
+        logging.warning(f"SVG path could not be tokenized after : {remainder}")
+
+    commands = []
+    for token in tokens:
+        if isinstance(token, str):
+            commands.append((token, []))
+        elif commands:
+            commands[-1][1].append(token)
+
+    return tuple((command, tuple(arguments)) for command, arguments in commands)
+
+
+def construct_svg_command(cmd_class: type, arguments: Tuple[float, ...]) -> BaseModel:
+    # Arguments are already numbers from the tokenizer : only cast them to the
+    # field types and skip the pydantic validation
+    return cmd_class.model_construct(
+        **{
+            name: cmd_field.annotation(value)
+            for (name, cmd_field), value in zip(
+                cmd_class.model_fields.items(), arguments
+            )
+        }
+    )
 
-    path_splited = re.findall(r"([a-zA-Z])([ ,\-\+.\d]+)", svg_path)
 
+def parse_svg_path(svg_path: str) -> list:
     parsed_path = []
-    for path_command in path_splited:
-        if cmd_class_info := svg_path_handlers.get(path_command[0]):
+    for command, arguments in tokenize_svg_path(svg_path):
+        if cmd_class_info := svg_path_handlers.get(command):
             cmd_class, cmd_nb_arguments = cmd_class_info
-            arguments = path_command[1].strip().split(" ")
+            if cmd_nb_arguments == 0:
+                parsed_path.append(construct_svg_command(cmd_class, ()))
+                continue
+            # model_construct does not validate : never build a partial command
+            nb_complete = len(arguments) - len(arguments) % cmd_nb_arguments
+            if nb_complete != len(arguments):
+                logging.warning(
+                    f"Incomplete SVG command {command} ignored :"
+                    f" {arguments[nb_complete:]}"
+                )
             # if multiple (x y) in a command
             parsed_path.extend(
-                cmd_class(
-                    **dict(
-                        zip(cmd_class.__fields__, arguments[i : i + cmd_nb_arguments])
-                    )
-                )
-                for i in range(0, len(arguments), cmd_nb_arguments or 1)
+                construct_svg_command(cmd_class, arguments[i : i + cmd_nb_arguments])
+                for i in range(0, nb_complete, cmd_nb_arguments)
             )
         else:
             logging.warning("SVG command path not supported")
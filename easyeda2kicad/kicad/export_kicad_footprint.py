@@ -3,7 +3,7 @@ import logging
 from math import acos, cos, isnan, pi, sin, sqrt
 from typing import Tuple, Union
 
-from easyeda2kicad.easyeda.parameters_easyeda import ee_footprint
+from easyeda2kicad.easyeda.parameters_easyeda import convert_to_mm, ee_footprint
 from easyeda2kicad.kicad.parameters_kicad_footprint import *
 
 # ---------------------------------------
@@ -113,7 +113,7 @@ def compute_arc(
 
 def fp_to_ki(dim: float) -> float:
     if dim not in ["", None] and isnan(float(dim)) is False:
-        return round(float(dim) * 10 * 0.0254, 2)
+        return round(convert_to_mm(dim), 2)
     return dim
 
 
@@ -175,44 +175,28 @@ class ExporterFootprintKicad:
 
     def generate_kicad_footprint(self) -> None:
         # Convert dimension from easyeda to kicad
-        self.input.bbox.convert_to_mm()
-
-        for fields in (
-            self.input.pads,
-            self.input.tracks,
-            self.input.holes,
-            self.input.vias,
-            self.input.circles,
-            self.input.rectangles,
-            self.input.texts,
-        ):
-            for field in fields:
-                field.convert_to_mm()
+        self.input.convert_to_mm()
 
         ki_info = KiFootprintInfo(
             name=self.input.info.name, fp_type=self.input.info.fp_type
         )
 
         if self.input.model_3d is not None:
-            self.input.model_3d.convert_to_mm()
-
-            # if self.input.model_3d.translation.z != 0:
-            #     self.input.model_3d.translation.z -= 1
+            # if self.input.model_3d.tz != 0:
+            #     self.input.model_3d.tz -= 1
             ki_3d_model_info = Ki3dModel(
                 name=self.input.model_3d.name,
                 translation=Ki3dModelBase(
-                    x=round((self.input.model_3d.translation.x - self.input.bbox.x), 2),
-                    y=-round(
-                        (self.input.model_3d.translation.y - self.input.bbox.y), 2
-                    ),
-                    z=-round(self.input.model_3d.translation.z, 2)
+                    x=round((self.input.model_3d.tx - self.input.bbox.x), 2),
+                    y=-round((self.input.model_3d.ty - self.input.bbox.y), 2),
+                    z=-round(self.input.model_3d.tz, 2)
                     if self.input.info.fp_type == "smd"
                     else 0,
                 ),
                 rotation=Ki3dModelBase(
-                    x=(360 - self.input.model_3d.rotation.x) % 360,
-                    y=(360 - self.input.model_3d.rotation.y) % 360,
-                    z=(360 - self.input.model_3d.rotation.z) % 360,
+                    x=(360 - self.input.model_3d.rx) % 360,
+                    y=(360 - self.input.model_3d.ry) % 360,
+                    z=(360 - self.input.model_3d.rz) % 360,
                 ),
                 raw_wrl=None,
             )
@@ -250,7 +234,7 @@ class ExporterFootprintKicad:
 
             # For custom polygon
             is_custom_shape = ki_pad.shape == "custom"
-            point_list = [fp_to_ki(point) for point in ee_pad.points.split(" ")]
+            point_list = [(fp_to_ki(x), fp_to_ki(y)) for x, y in ee_pad.xy]
             if is_custom_shape:
                 if len(point_list) <= 0:
                     logging.warning(
@@ -269,12 +253,10 @@ class ExporterFootprintKicad:
                     # Generate polygon with coordinates relative to the base pad's position.
                     path = "".join(
                         "(xy {} {})".format(
-                            round(point_list[i] - self.input.bbox.x - ki_pad.pos_x, 2),
-                            round(
-                                point_list[i + 1] - self.input.bbox.y - ki_pad.pos_y, 2
-                            ),
+                            round(x - self.input.bbox.x - ki_pad.pos_x, 2),
+                            round(y - self.input.bbox.y - ki_pad.pos_y, 2),
                         )
-                        for i in range(0, len(point_list), 2)
+                        for x, y in point_list
                     )
                     ki_pad.polygon = (
                         "\n\t\t(primitives \n\t\t\t(gr_poly \n\t\t\t\t(pts"
@@ -293,20 +275,12 @@ class ExporterFootprintKicad:
             )
 
             # Generate line
-            point_list = [fp_to_ki(point) for point in ee_track.points.split(" ")]
-            for i in range(0, len(point_list) - 2, 2):
-                ki_track.points_start_x.append(
-                    round(point_list[i] - self.input.bbox.x, 2)
-                )
-                ki_track.points_start_y.append(
-                    round(point_list[i + 1] - self.input.bbox.y, 2)
-                )
-                ki_track.points_end_x.append(
-                    round(point_list[i + 2] - self.input.bbox.x, 2)
-                )
-                ki_track.points_end_y.append(
-                    round(point_list[i + 3] - self.input.bbox.y, 2)
-                )
+            point_list = [(fp_to_ki(x), fp_to_ki(y)) for x, y in ee_track.xy]
+            for (start_x, start_y), (end_x, end_y) in zip(point_list, point_list[1:]):
+                ki_track.points_start_x.append(round(start_x - self.input.bbox.x, 2))
+                ki_track.points_start_y.append(round(start_y - self.input.bbox.y, 2))
+                ki_track.points_end_x.append(round(end_x - self.input.bbox.x, 2))
+                ki_track.points_end_y.append(round(end_y - self.input.bbox.y, 2))
 
             self.output.tracks.append(ki_track)
 
@@ -385,15 +359,12 @@ class ExporterFootprintKicad:
 
         # For arcs
         for ee_arc in self.input.arcs:
-            arc_path = (
-                ee_arc.path.replace(",", " ").replace("M ", "M").replace("A ", "A")
-            )
+            (_, move_to_arguments), (_, arc_arguments) = ee_arc.tokens[:2]
 
-            start_x, start_y = arc_path.split("A")[0][1:].split(" ", 1)
+            start_x, start_y = move_to_arguments[:2]
             start_x = fp_to_ki(start_x) - self.input.bbox.x
             start_y = fp_to_ki(start_y) - self.input.bbox.y
 
-            arc_parameters = arc_path.split("A")[1].replace("  ", " ")
             (
                 svg_rx,
                 svg_ry,
@@ -402,7 +373,7 @@ class ExporterFootprintKicad:
                 sweep,
                 end_x,
                 end_y,
-            ) = arc_parameters.split(" ", 6)
+            ) = arc_arguments[:7]
             rx, ry = rotate(fp_to_ki(svg_rx), fp_to_ki(svg_ry), 0)
 
             end_x = fp_to_ki(end_x) - self.input.bbox.x
@@ -414,8 +385,8 @@ class ExporterFootprintKicad:
                     rx,
                     ry,
                     float(x_axis_rotation),
-                    large_arc == "1",
-                    sweep == "1",
+                    large_arc == 1,
+                    sweep == 1,
                     end_x,
                     end_y,
                 )
@@ -63,11 +63,13 @@ def convert_ee_pins(
             pos_y=-to_ki(int(ee_pin.settings.pos_y) - int(ee_bbox.y)),
         )
 
-        if ee_pin.dot.is_displayed and ee_pin.clock.is_displayed:
+        is_inverted = ee_pin.dot is not None and ee_pin.dot.is_displayed
+        is_clock = ee_pin.clock is not None and ee_pin.clock.is_displayed
+        if is_inverted and is_clock:
             ki_pin.style = KiPinStyle.inverted_clock
-        elif ee_pin.dot.is_displayed:
+        elif is_inverted:
             ki_pin.style = KiPinStyle.inverted
-        elif ee_pin.clock.is_displayed:
+        elif is_clock:
             ki_pin.style = KiPinStyle.clock
 
         # Deal with different pin length
@@ -212,18 +214,12 @@ def convert_ee_polylines(
     to_ki: Callable = px_to_mil if kicad_version == KicadVersion.v5 else px_to_mm
     kicad_polygons = []
     for ee_polyline in ee_polylines:
-        raw_pts = ee_polyline.points.split(" ")
-        # print(raw_pts)
-        x_points = [
-            to_ki(int(float(raw_pts[i])) - int(ee_bbox.x))
-            for i in range(0, len(raw_pts), 2)
-        ]
-        y_points = [
-            -to_ki(int(float(raw_pts[i])) - int(ee_bbox.y))
-            for i in range(1, len(raw_pts), 2)
-        ]
-
-        if isinstance(ee_polyline, EeSymbolPolygon) or ee_polyline.fill_color:
+        x_points = [to_ki(int(x) - int(ee_bbox.x)) for x, _ in ee_polyline.xy]
+        y_points = [-to_ki(int(y) - int(ee_bbox.y)) for _, y in ee_polyline.xy]
+
+        if x_points and (
+            isinstance(ee_polyline, EeSymbolPolygon) or ee_polyline.fill_color
+        ):
             x_points.append(x_points[0])
             y_points.append(y_points[0])
         if len(x_points) > 0 and len(y_points) > 0:
@@ -261,22 +257,19 @@ def convert_ee_paths(
     to_ki: Callable = px_to_mil if kicad_version == KicadVersion.v5 else px_to_mm
 
     for ee_path in ee_paths:
-        raw_pts = ee_path.paths.split(" ")
-
         x_points = []
         y_points = []
 
         # Small svg path parser : doc -> https://www.w3.org/TR/SVG11/paths.html#PathElement
 
-        for i in range(len(raw_pts)):
-            if raw_pts[i] in ["M", "L"]:
-                x_points.append(to_ki(int(float(raw_pts[i + 1])) - int(ee_bbox.x)))
-                y_points.append(-to_ki(int(float(raw_pts[i + 2])) - int(ee_bbox.y)))
-                i += 2
-            elif raw_pts[i] == "Z":
+        for command, arguments in ee_path.tokens:
+            if command in ["M", "L"]:
+                x_points.append(to_ki(int(arguments[0]) - int(ee_bbox.x)))
+                y_points.append(-to_ki(int(arguments[1]) - int(ee_bbox.y)))
+            elif command == "Z":
                 x_points.append(x_points[0])
                 y_points.append(y_points[0])
-            elif raw_pts[i] == "C":
+            elif command == "C":
                 ...
                 # TODO : Add bezier support
 
@@ -5,6 +5,8 @@ with open("README.md") as fh:
 
 production_dependencies = ["pydantic>=2.0.0", "requests>2.0.0"]
 
+optional_dependencies = ["orjson>=3.0.0"]
+
 development_dependencies = [
     "pre-commit>=2.17.0",
 ]
@@ -36,7 +38,7 @@ setup(
     entry_points={"console_scripts": ["easyeda2kicad = easyeda2kicad.__main__:main"]},
     python_requires=">=3.6",
     install_requires=production_dependencies,
-    extras_require={"dev": development_dependencies},
+    extras_require={"dev": development_dependencies, "fast": optional_dependencies},
     zip_safe=False,
     keywords="easyeda kicad library conversion",
     classifiers=[